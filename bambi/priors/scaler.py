@@ -14,7 +14,7 @@ from bambi.model_components import ConstantComponent
 from bambi.priors.prior import Prior
 
 
-class PriorScaler:
+class PriorScaler:  # pylint: disable=too-many-instance-attributes
     """Scale prior distributions parameters."""
 
     # Standard deviation multipliefr.
@@ -22,15 +22,29 @@ class PriorScaler:
 
     def __init__(self, model):
         self.model = model
+        self._family = model.family
+        self._components = model.components
         self.response_component = model.response_component
-        self.parent_component = model.components[model.family.likelihood.parent]
+        self.parent_component = self._components[self._family.likelihood.parent]
         self.has_intercept = self.parent_component.intercept_term is not None
         self.priors = {}
 
+        # Family dispatch flags, they're used for every scaled term
+        self._is_gaussian_studentt = isinstance(self._family, (Gaussian, StudentT))
+        self._is_bern_binom_logit_probit = isinstance(
+            self._family, (Bernoulli, Binomial)
+        ) and self._family.link["p"].name in ("logit", "probit")
+
+        # Sum of the products between squared sigmas and squared column means of the scaled
+        # common terms. It's accumulated as terms are scaled and it's used to adjust the intercept.
+        self._intercept_var_adjustment = 0.0
+
         # Compute mean and std of the response
-        if isinstance(self.model.family, (Gaussian, StudentT)):
-            self.response_mean = np.mean(self.response_component.term.data)
-            self.response_std = np.std(self.response_component.term.data)
+        if self._is_gaussian_studentt:
+            # Use float64 to avoid the loss of accuracy of 'np.std' with float32 data
+            data = np.ascontiguousarray(self.response_component.term.data, dtype=np.float64)
+            self.response_mean = data.mean()
+            self.response_std = data.std()
         else:
             self.response_mean = 0
             self.response_std = 1
@@ -40,43 +54,32 @@ class PriorScaler:
         sigma = self.STD * self.response_std
         # Only adjust sigma if there is at least one Normal prior for a common term.
         if self.priors:
-            sigmas = np.hstack([prior["sigma"] for prior in self.priors.values()])
-            x_mean = np.hstack(
-                [self.parent_component.terms[term].data.mean(axis=0) for term in self.priors]
-            )
-            sigma = (sigma**2 + np.dot(sigmas**2, x_mean**2)) ** 0.5
+            sigma = (sigma**2 + self._intercept_var_adjustment) ** 0.5
 
         return mu, sigma
 
     def get_slope_sigma(self, x):
-        return self.STD * (self.response_std / np.std(x))
+        # When 'x' is 2D, there's one sigma per column
+        return self.STD * (self.response_std / np.std(x, axis=0, dtype=np.float64))
 
     def scale_response(self):
         # Here we would add cases for other families if we wanted
-        if isinstance(self.model.family, (Gaussian, StudentT)):
-            sigma = self.model.components["sigma"]
-            if (
-                isinstance(sigma, ConstantComponent)
-                and hasattr(sigma.prior, "auto_scale")  # not available when `.prior` is a scalar
-                and sigma.prior.auto_scale
-            ):
+        if self._is_gaussian_studentt:
+            sigma = self._components.get("sigma")
+            # `.auto_scale` is not available when `.prior` is a scalar
+            if isinstance(sigma, ConstantComponent) and getattr(sigma.prior, "auto_scale", False):
                 sigma.prior = Prior("HalfStudentT", nu=4, sigma=self.response_std)
-        elif isinstance(self.model.family, VonMises):
-            kappa = self.model.components["kappa"]
-            if (
-                isinstance(kappa, ConstantComponent)
-                and hasattr(kappa.prior, "auto_scale")  # not available when `.prior` is a scalar
-                and kappa.prior.auto_scale
-            ):
+        elif isinstance(self._family, VonMises):
+            kappa = self._components.get("kappa")
+            # `.auto_scale` is not available when `.prior` is a scalar
+            if isinstance(kappa, ConstantComponent) and getattr(kappa.prior, "auto_scale", False):
                 kappa.prior = Prior("HalfStudentT", nu=4, sigma=self.response_std)
 
     def scale_intercept(self, term):
         if term.prior.name != "Normal":
             return
         # Special case for logit/probit links with bernoulli or binomial family
-        if isinstance(self.model.family, (Bernoulli, Binomial)) and self.model.family.link[
-            "p"
-        ].name in ["logit", "probit"]:
+        if self._is_bern_binom_logit_probit:
             mu = 0
             sigma = 1.5
         else:
@@ -87,62 +90,55 @@ class PriorScaler:
         if term.prior.name != "Normal":
             return
 
-        if term.data.ndim == 1:
+        # Use contiguous float64 data, reductions are slower on object-dtype or strided arrays
+        data = np.ascontiguousarray(term.data, dtype=np.float64)
+
+        # For interaction terms, distinguish cases where all factor terms are categorical
+        is_interaction = term.kind == "interaction"
+        all_categoric_interaction = is_interaction and all(
+            component.kind == "categoric" for component in term.term.components
+        )
+
+        if data.ndim == 1:
             mu = 0
             # Special case for logit/probit links with bernoulli or binomial family
-            if isinstance(self.model.family, (Bernoulli, Binomial)) and self.model.family.link[
-                "p"
-            ].name in ["logit", "probit"]:
-                # For interaction terms, distinguish cases where all factor terms are categorical
-                if term.kind == "interaction":
-                    all_categoric = all(
-                        component.kind == "categoric" for component in term.term.components
-                    )
-                    if all_categoric:
-                        sigma = 1
-                    else:
-                        sigma = 1 / np.std(term.data, axis=0)
+            if self._is_bern_binom_logit_probit:
+                if all_categoric_interaction:
+                    sigma = 1
                 # Single categorical term
-                elif term.categorical:
+                elif term.categorical and not is_interaction:
                     sigma = 1
-                # Single numerical term
+                # Single numerical term or interaction with a numerical factor
                 else:
-                    sigma = 1 / np.std(term.data, axis=0)
+                    sigma = 1 / np.std(data, axis=0)
             # If not, fall back to the regular case
             else:
-                sigma = self.get_slope_sigma(term.data)
+                sigma = self.get_slope_sigma(data)
         # It's a term that spans multiple columns of the design matrix
         else:
-            mu = np.zeros(term.data.shape[1])
-            sigma = np.zeros(term.data.shape[1])
+            mu = np.zeros(data.shape[1])
+            sigma = np.zeros(data.shape[1])
             # Special case for logit/probit links with bernoulli or binomial family
-            if isinstance(self.model.family, (Bernoulli, Binomial)) and self.model.family.link[
-                "p"
-            ].name in ["logit", "probit"]:
-                # Iterate over columns in the data
-                for i, value in enumerate(term.data.T):
-                    if term.kind == "interaction":
-                        # Distinguish cases where all interaction factor terms are categorical
-                        all_categoric = all(
-                            component.kind == "categoric" for component in term.term.components
-                        )
-                        if all_categoric:
-                            sigma[i] = 1
-                        # It's the std dev of the marginal numerical variable (_not_ by group)
-                        else:
-                            sigma[i] = 1 / np.std(np.sum(term.data, axis=1))
-                    # Single categorical term
-                    elif term.categorical:
-                        sigma[i] = 1
-                    # Single numerical term
-                    else:
-                        sigma[i] = 1 / np.std(term.data, axis=0)
+            if self._is_bern_binom_logit_probit:
+                if all_categoric_interaction:
+                    sigma[:] = 1
+                # It's the std dev of the marginal numerical variable (_not_ by group)
+                elif is_interaction:
+                    sigma[:] = 1 / np.std(np.sum(data, axis=1))
+                # Single categorical term
+                elif term.categorical:
+                    sigma[:] = 1
+                # Single numerical term
+                else:
+                    sigma = 1 / np.std(data, axis=0)
             else:
-                for i, value in enumerate(term.data.T):
-                    sigma[i] = self.get_slope_sigma(value)
+                sigma = self.get_slope_sigma(data)
 
         # Save and set prior
         self.priors.update({term.name: {"mu": mu, "sigma": sigma}})
+        self._intercept_var_adjustment += np.dot(
+            np.atleast_1d(sigma) ** 2, np.atleast_1d(data.mean(axis=0)) ** 2
+        )
         term.prior.update(mu=mu, sigma=sigma)
 
     def scale_group_specific(self, term):
@@ -155,31 +151,32 @@ class PriorScaler:
         # Handle slopes
         else:
             # Recreate the corresponding common effect data
-            if len(term.predictor.shape) == 2:
-                data_as_common = term.predictor
-            else:
-                data_as_common = term.predictor[:, None]
-            sigma = np.zeros(data_as_common.shape[1])
-            for i, value in enumerate(data_as_common.T):
-                sigma[i] = self.get_slope_sigma(value)
+            data_as_common = np.ascontiguousarray(term.predictor, dtype=np.float64)
+            if data_as_common.ndim == 1:
+                data_as_common = data_as_common[:, None]
+            sigma = self.get_slope_sigma(data_as_common)
         term.prior.args["sigma"].update(sigma=np.squeeze(np.atleast_1d(sigma)))
 
     def scale_threshold(self):
-        if isinstance(self.model.family, Cumulative):
-            threshold = self.model.components["threshold"]
-            if isinstance(threshold, ConstantComponent) and threshold.prior.auto_scale:
-                response_level_n = len(np.unique(self.response_component.term.data))
-                mu = np.round(np.linspace(-2, 2, num=response_level_n - 1), 2)
+        if isinstance(self._family, Cumulative):
+            threshold = self._components.get("threshold")
+            if isinstance(threshold, ConstantComponent) and getattr(
+                threshold.prior, "auto_scale", False
+            ):
+                response_level_n = len(self.response_component.term.levels)
+                mu = np.linspace(-2, 2, num=response_level_n - 1)
                 threshold.prior = Prior(
                     "Normal",
                     mu=mu,
                     sigma=1,
                     transform=pm.distributions.transforms.ordered,
                 )
-        elif isinstance(self.model.family, StoppingRatio):
-            threshold = self.model.components["threshold"]
-            if isinstance(threshold, ConstantComponent) and threshold.prior.auto_scale:
-                response_level_n = len(np.unique(self.response_component.term.data))
+        elif isinstance(self._family, StoppingRatio):
+            threshold = self._components.get("threshold")
+            if isinstance(threshold, ConstantComponent) and getattr(
+                threshold.prior, "auto_scale", False
+            ):
+                response_level_n = len(self.response_component.term.levels)
                 mu = np.zeros(response_level_n - 1)
                 threshold.prior = Prior("Normal", mu=mu, sigma=1)
 
@@ -187,21 +184,36 @@ class PriorScaler:
         # Scale response
         self.scale_response()
 
+        # Scale threshold parameters in ordinal families
+        self.scale_threshold()
+
+        # Select the terms in the parent component whose priors are scaled automatically
+        common_terms = [
+            term
+            for term in self.parent_component.common_terms.values()
+            if getattr(term.prior, "auto_scale", False)
+        ]
+        group_specific_terms = [
+            term
+            for term in self.parent_component.group_specific_terms.values()
+            if term.prior.auto_scale
+        ]
+        scale_intercept = (
+            self.has_intercept and self.parent_component.intercept_term.prior.auto_scale
+        )
+
+        # Nothing else to do when all the priors of the terms were set by the user
+        if not (common_terms or group_specific_terms or scale_intercept):
+            return
+
         # Scale common terms
-        for term in self.parent_component.common_terms.values():
-            if hasattr(term.prior, "auto_scale") and term.prior.auto_scale:
-                self.scale_common(term)
+        for term in common_terms:
+            self.scale_common(term)
 
         # Scale intercept
-        if self.has_intercept:
-            term = self.parent_component.intercept_term
-            if term.prior.auto_scale:
-                self.scale_intercept(term)
+        if scale_intercept:
+            self.scale_intercept(self.parent_component.intercept_term)
 
         # Scale group-specific terms
-        for term in self.parent_component.group_specific_terms.values():
-            if term.prior.auto_scale:
-                self.scale_group_specific(term)
-
-        # Scale threshold parameters in ordinal families
-        self.scale_threshold()
+        for term in group_specific_terms:
+            self.scale_group_specific(term)
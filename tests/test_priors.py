@@ -122,6 +122,42 @@ def test_auto_scale(diabetes_data):
     assert p3_off.name == "Cauchy"
 
 
+def test_auto_scale_intercept(diabetes_data):
+    # The intercept sigma accounts for the priors and the column means of the common terms
+    model = bmb.Model("BMI ~ S1 + S2 + age_grp", diabetes_data)
+    parent_component = model.components[model.family.likelihood.parent]
+    y_std = np.std(diabetes_data["BMI"])
+    adjustment = 0
+    for name in ["S1", "S2", "age_grp"]:
+        sigma = parent_component.terms[name].prior.args["sigma"]
+        assert np.allclose(sigma, 2.5 * y_std / np.std(diabetes_data[name]))
+        adjustment += (sigma * np.mean(diabetes_data[name])) ** 2
+    intercept_prior = parent_component.terms["Intercept"].prior
+    assert np.isclose(intercept_prior.args["mu"], np.mean(diabetes_data["BMI"]))
+    assert np.isclose(intercept_prior.args["sigma"], ((2.5 * y_std) ** 2 + adjustment) ** 0.5)
+
+
+def test_auto_scale_float32_response():
+    # Response statistics are computed in float64 even if the response is float32
+    rng = np.random.default_rng(121195)
+    data = pd.DataFrame({"y": (1e4 + rng.normal(scale=1e-2, size=10_000)).astype(np.float32)})
+    model = bmb.Model("y ~ 1", data)
+    y = data["y"].to_numpy(dtype=np.float64)
+    assert np.isclose(model.components["sigma"].prior.args["sigma"], np.std(y), rtol=1e-12)
+    intercept_prior = model.components["mu"].terms["Intercept"].prior
+    assert np.isclose(intercept_prior.args["mu"], np.mean(y), rtol=1e-12)
+
+
+def test_auto_scale_multicolumn_numeric_bernoulli():
+    # Each column of a multi-column numerical term gets its own sigma
+    rng = np.random.default_rng(121195)
+    data = pd.DataFrame({"y": rng.integers(0, 2, size=100), "x": rng.normal(size=100)})
+    model = bmb.Model("y ~ poly(x, 2, raw=True)", data, family="bernoulli")
+    term = model.components["p"].terms["poly(x, 2, raw=True)"]
+    assert term.prior.args["sigma"].shape == (2,)
+    assert np.allclose(term.prior.args["sigma"], 1 / np.std(term.data, axis=0))
+
+
 def test_prior_str():
     # Tests __str__ method
     prior1 = bmb.Prior("Normal", mu=0, sigma=1)
@@ -362,3 +398,18 @@ def test_custom_prior():
     model = bmb.Model("y ~ x", data, priors=priors)
     model.build()
     assert model.backend.model.free_RVs[-1].str_repr() == "x ~ Normal(0, 5)"
+
+
+@pytest.mark.parametrize("family", ["cumulative", "sratio"])
+def test_threshold_prior_shape(family):
+    # The number of thresholds is given by the levels of the response, even if some are not observed
+    rng = np.random.default_rng(121195)
+    y = rng.choice([1, 2, 4, 5], size=100)
+    data = pd.DataFrame(
+        {
+            "y": pd.Categorical(y, categories=[1, 2, 3, 4, 5], ordered=True),
+            "x": rng.normal(size=100),
+        }
+    )
+    model = bmb.Model("y ~ x", data, family=family)
+    assert model.components["threshold"].prior.args["mu"].shape == (4,)